@@ -6,14 +6,84 @@ import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import plotly.io as pio
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from fpdf import FPDF
-import tempfile
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
+import hashlib
 import io
+import pickle
 import re
+import time
 import traceback
-from pathlib import Path
+import warnings
+import zlib
+
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = None
+
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = None
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    import zstandard
+    _compress = zstandard.ZstdCompressor(level=3).compress
+    _decompress = zstandard.ZstdDecompressor().decompress
+except ImportError:
+    _compress, _decompress = zlib.compress, zlib.decompress
+
+# st.plotly_chart serializes every figure through plotly.io.to_json on each rerun
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# The pairwise-complete BLAS path allocates two extra N x K float64 temporaries when NaNs are
+# present; past this many cells the numba kernel, which reads the block in place with O(K)
+# scratch per thread, trades speed for not allocating them
+_NUMBA_MIN_CELLS = 50_000_000
+
+# Partial reruns need Streamlit >= 1.33; older versions simply rerun the whole script
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Interval between reruns while a PDF report is being generated in the background
+_REPORT_POLL_SECONDS = 0.5
+
+def _fragment_every(seconds):
+    """Fragment decorator that reruns the fragment on a timer; without fragments the whole script reruns"""
+    fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if fragment is not None:
+        return fragment(run_every=seconds)
+    def decorator(func):
+        @functools.wraps(func)
+        def poll(*args, **kwargs):
+            func(*args, **kwargs)
+            time.sleep(seconds)
+            st.rerun()
+        return poll
+    return decorator
+
+# Datasets kept by the process-wide caches; they are shared by every session, so keep them bounded
+_CACHED_DATASETS = 4
+
+# CSV uploads larger than this are parsed in row chunks to cap peak memory
+_CHUNKED_READ_BYTES = 200 * 1024 * 1024
+_CSV_CHUNK_ROWS = 200_000
 
 # Page configuration
 st.set_page_config(
@@ -23,10 +93,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for red, gray & white theme with black text
-# Custom CSS for tabs
-
-st.markdown("""
+# Custom CSS for red, gray & white theme with black text, and for tabs.
+# Kept in a single <style> block so each rerun sends one markdown element.
+_APP_CSS = """
 <style>
     body, .stApp {
         background-color: white !important;
@@ -86,21 +155,324 @@ st.markdown("""
     .stButton button:hover {
         background-color: #800000 !important;
     }
+    /* Tab bar */
+    .stTabs [data-baseweb="tab-list"] {
+        background-color:#0A090 ; /* Tab container background */
+        border-radius: 15px;
+        padding: 5px;
+    }
+    /* Individual tab */
+    .stTabs [data-baseweb="tab"] {
+        background-color:#B1B1B1 ; /* Inactive tab */
+        color: white !important;
+        border-radius: 10px;
+        margin-right: 15px;
+    }
+    /* Active tab */
+    .stTabs [aria-selected="true"] {
+        background-color:#96090B  !important; /* Active tab color */
+        color: black !important;
+        font-weight: bold;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+@st.cache_data(max_entries=_CACHED_DATASETS, show_spinner=False)
+def _read_file(file_bytes, filename):
+    """Parse uploaded file bytes into a DataFrame"""
+    buffer = io.BytesIO(file_bytes)
+    if filename.endswith('.csv'):
+        if len(file_bytes) > _CHUNKED_READ_BYTES:
+            # shrink each chunk before concatenating so the float64/int64 frame never exists in full
+            chunks = pd.read_csv(buffer, chunksize=_CSV_CHUNK_ROWS)
+            df = pd.concat([_optimize_dtypes(chunk, categorize=False) for chunk in chunks], ignore_index=True)
+        else:
+            df = _read_csv(buffer)
+    elif filename.endswith('.parquet'):
+        df = pd.read_parquet(buffer)
+    else:
+        df = pd.read_excel(buffer, engine=_EXCEL_ENGINE)
+    return _optimize_dtypes(df)
+
+def _read_csv(buffer):
+    """read_csv with the fast engine, falling back to the C engine wherever the two disagree"""
+    if _CSV_ENGINE is not None:
+        try:
+            df = pd.read_csv(buffer, engine=_CSV_ENGINE)
+        except ValueError:
+            # parse/decode errors (ragged rows, bad encodings) get the C engine's handling
+            df = None
+        # pyarrow keeps undecodable text as raw bytes where the C engine raises UnicodeDecodeError
+        if df is not None and not any(
+            isinstance(value, bytes)
+            for col in df.select_dtypes(include='object').columns
+            for value in df[col].dropna().head(1)
+        ):
+            return df
+        buffer.seek(0)
+    return pd.read_csv(buffer)
+
+def _optimize_dtypes(df, categorize=True):
+    """Downcast numeric columns and store low-cardinality text as category"""
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_integer_dtype(s):
+            # min() is NA for an empty or all-NA nullable column
+            lo = s.min()
+            df[col] = pd.to_numeric(s, downcast='unsigned' if pd.notna(lo) and lo >= 0 else 'integer')
+        elif pd.api.types.is_float_dtype(s):
+            # only keep float32 when it round-trips exactly, so the stats don't drift
+            down = pd.to_numeric(s, downcast='float')
+            if down.dtype != s.dtype and np.array_equal(down.to_numpy(np.float64), s.to_numpy(np.float64), equal_nan=True):
+                df[col] = down
+        elif categorize and s.dtype == object and len(df) > 0 and s.nunique(dropna=False) / len(df) < 0.5:
+            df[col] = s.astype('category')
+    return df
+
+@st.cache_data(max_entries=_CACHED_DATASETS, show_spinner=False)
+def _analyze(file_bytes, filename):
+    """Comprehensive EDA cached on the uploaded file contents"""
+    return _analyze_frame(_read_file(file_bytes, filename))
+
+@st.cache_data(max_entries=_CACHED_DATASETS, show_spinner=False)
+def _analyze_dataframe(df):
+    """Comprehensive EDA cached on the contents of an in-memory DataFrame"""
+    return _analyze_frame(df)
+
+def _analyze_frame(df):
+    """Perform comprehensive EDA on a DataFrame"""
+    results = {}
+    
+    # Basic statistics
+    results['shape'] = df.shape
+    results['columns'] = list(df.columns)
+    results['data_types'] = {col: str(dtype) for col, dtype in df.dtypes.items()}
+    missing = len(df) - df.count()
+    # kept as Series: consumers only need totals, and to_dict() boxes one object per column
+    results['missing_values'] = missing
+    results['missing_percentage'] = missing / len(df) * 100
+    results['duplicates'] = _count_duplicates(df)
+    
+    # Overview tables rendered as-is by the Dataset Overview tab
+    results['dtype_df'] = pd.DataFrame({
+        'Column': results['columns'],
+        'Data Type': list(results['data_types'].values())
+    })
+    results['missing_df'] = pd.DataFrame({
+        'Column': missing.index,
+        'Missing Count': missing.to_numpy(),
+        'Missing %': results['missing_percentage'].to_numpy()
+    })
+    
+    # Numeric columns analysis (one float64 block shared by stats and correlation)
+    numeric_df = df.select_dtypes(include=[np.number])
+    numeric_cols = list(numeric_df.columns)
+    results['numeric_columns'] = numeric_cols
+    results['numeric_stats'] = {}
+    results['histograms'] = {}
+    if numeric_cols:
+        X = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        results['numeric_stats'], corr = _numeric_summary(X, numeric_cols)
+        # binned once here and reused by the distribution plots
+        results['histograms'] = {col: _histogram(X[:, k]) for k, col in enumerate(numeric_cols)}
+    
+    # Categorical columns analysis
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    results['categorical_columns'] = list(categorical_cols)
+    results['categorical_stats'] = {}
+    for col in categorical_cols:
+        # one value_counts pass gives both the cardinality and the top categories
+        counts = df[col].value_counts()
+        # category dtypes report unused categories with a zero count
+        counts = counts[counts > 0]
+        results['categorical_stats'][col] = {
+            'unique_count': len(counts),
+            'top_categories': counts.head(5).to_dict()
+        }
+    
+    # Correlation analysis (kept as a plain array + column list so caching stays cheap)
+    if len(numeric_cols) > 1:
+        results['correlation_matrix'] = corr
+        results['correlation_columns'] = numeric_cols
+    
+    return results
+
+def _histogram(values):
+    """Counts and bin edges over the finite values of a column"""
+    values = values[np.isfinite(values)]
+    return np.histogram(values, bins=_HIST_BINS)
+
+def _count_duplicates(df):
+    """Number of duplicate rows from one 64-bit hash per row"""
+    if df.shape[1] == 0:
+        return 0
+    return len(df) - pd.util.hash_pandas_object(df, index=False).nunique()
+
+def _numeric_summary(X, numeric_cols):
+    """describe()-style stats and Pearson correlation from one float64 block"""
+    if X.shape[0] == 0:
+        X = np.full((1, X.shape[1]), np.nan)  # empty frame: every stat is NaN, counts are 0
+    nan_mask = np.isnan(X)
+    counts = X.shape[0] - nan_mask.sum(axis=0)
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        means = np.nansum(X, axis=0) / counts
+        Xc = np.where(nan_mask, 0.0, X - means)
+        stds = np.where(counts > 1, np.sqrt((Xc * Xc).sum(axis=0) / (counts - 1)), np.nan)
+        mins = np.nanmin(X, axis=0)
+        maxs = np.nanmax(X, axis=0)
+        quartiles = np.nanpercentile(X, [25, 50, 75], axis=0)
+
+        corr = _pearson_matrix(Xc, nan_mask)
+
+    stats = {}
+    for k, col in enumerate(numeric_cols):
+        stats[col] = {
+            'count': float(counts[k]),
+            'mean': means[k],
+            'std': stds[k],
+            'min': mins[k],
+            '25%': quartiles[0, k],
+            '50%': quartiles[1, k],
+            '75%': quartiles[2, k],
+            'max': maxs[k]
+        }
+    return stats, corr
+
+def _pearson_matrix(Xc, nan_mask):
+    """Pearson correlation of a centered block (NaNs zeroed), pairwise-complete like DataFrame.corr()"""
+    has_nans = nan_mask.any()
+    if _HAS_NUMBA and has_nans and Xc.size > _NUMBA_MIN_CELLS:
+        return _pearson_numba(Xc, nan_mask)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Gram matrices of the centered block; with NaNs the sums are
+        # restricted to the rows where both columns are present
+        if has_nans:
+            M = (~nan_mask).astype(np.float64)
+            n = M.T @ M
+            sx = Xc.T @ M
+            cov = Xc.T @ Xc - sx * sx.T / n
+            var_x = (Xc * Xc).T @ M - sx * sx / n
+            return cov / np.sqrt(var_x * var_x.T)
+        gram = Xc.T @ Xc
+        diag = np.sqrt(np.diag(gram))
+        return gram / np.outer(diag, diag)
+
+def _correlation(X):
+    """Pearson correlation of the columns of a float64 block that may contain NaNs"""
+    nan_mask = np.isnan(X)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        Xc = np.where(nan_mask, 0.0, X - np.nanmean(X, axis=0))
+    return _pearson_matrix(Xc, nan_mask)
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def _pearson_numba(Xc, nan_mask):
+        # row-major walk over the C-ordered block; NaN cells of Xc are already zero, so only
+        # the sums involving column i's values need the pairwise mask
+        n, K = Xc.shape
+        out = np.empty((K, K))
+        for i in prange(K):
+            cnt = np.zeros(K)
+            sx = np.zeros(K)
+            sy = np.zeros(K)
+            sxy = np.zeros(K)
+            sxx = np.zeros(K)
+            syy = np.zeros(K)
+            for r in range(n):
+                if nan_mask[r, i]:
+                    continue
+                x = Xc[r, i]
+                for j in range(i, K):
+                    w = 0.0 if nan_mask[r, j] else 1.0
+                    y = Xc[r, j]
+                    cnt[j] += w
+                    sx[j] += w * x
+                    sxx[j] += w * x * x
+                    sy[j] += y
+                    sxy[j] += x * y
+                    syy[j] += y * y
+            for j in range(i, K):
+                c = cnt[j]
+                r_ij = (sxy[j] - sx[j] * sy[j] / c) / np.sqrt((sxx[j] - sx[j] * sx[j] / c) * (syy[j] - sy[j] * sy[j] / c))
+                out[i, j] = r_ij
+                out[j, i] = r_ij
+        return out
+
+@st.cache_data(max_entries=_CACHED_DATASETS, show_spinner=False)
+def _generate_insights(analysis_results):
+    """Generate AI-like insights based on data analysis"""
+    insights = []
+    if not analysis_results:
+        return insights
+    
+    # Dataset overview insights
+    rows, cols = analysis_results.get('shape', (0,0))
+    insights.append(f"📚 <b>Data Overview</b>: The dataset contains {rows:,} rows and {cols} columns.")
+    
+    # Missing values insights
+    missing_values = analysis_results.get('missing_values')
+    total_missing = int(missing_values.sum()) if missing_values is not None else 0
+    if total_missing > 0:
+        insights.append(f"🕵🏼‍♂️ <b>Data Quality</b>: {total_missing:,} missing values detected across the dataset.")
+    
+    # Numeric columns insights
+    numeric_cols = analysis_results.get('numeric_columns', [])
+    if numeric_cols:
+        numeric_insight = f"🔢 <b>Numeric Analysis</b>: {len(numeric_cols)} numeric columns found."
+        col = numeric_cols[0]
+        stats = analysis_results.get('numeric_stats', {}).get(col, {})
+        if isinstance(stats, dict) and 'mean' in stats:
+            try:
+                numeric_insight += f" {col} has mean {stats['mean']:.2f} and std {stats['std']:.2f}."
+            except Exception:
+                numeric_insight += f" {col} stats available."
+        insights.append(numeric_insight)
+    
+    # Categorical insights
+    categorical_cols = analysis_results.get('categorical_columns', [])
+    if categorical_cols:
+        cat_insight = f"🗂️ <b>Categorical Analysis<b/>: {len(categorical_cols)} categorical columns identified."
+        insights.append(cat_insight)
+    
+    # Correlation insights
+    if analysis_results.get('correlation_matrix') is not None:
+        corr_matrix = np.asarray(analysis_results['correlation_matrix'])
+        corr_cols = analysis_results['correlation_columns']
+        rows_idx, cols_idx = np.triu_indices_from(corr_matrix, k=1)
+        vals = corr_matrix[rows_idx, cols_idx]
+        strong = np.flatnonzero(np.abs(vals) > 0.7)
+        # strongest pairs first
+        strong = strong[np.argsort(-np.abs(vals[strong]), kind='stable')]
+        high_corr_pairs = [
+            f"{corr_cols[rows_idx[k]]} & {corr_cols[cols_idx[k]]} ({vals[k]:.2f})"
+            for k in strong[:3]
+        ]
+        if high_corr_pairs:
+            insights.append(f"👨‍👩‍👧‍👦 <b>Strong Correlations</b>: Found between {', '.join(high_corr_pairs)}")
+    
+    # Data quality insights
+    if analysis_results.get('duplicates', 0) > 0:
+        insights.append(f"🔍 <b>Data Quality</b>: {analysis_results['duplicates']} duplicate rows found.")
+    
+    return insights
 
 class DataAnalyzer:
     def __init__(self):
         self.df = None
+        self.file_bytes = None
+        self.filename = None
         self.analysis_results = {}
         
     def load_data(self, uploaded_file):
         """Load data """
         try:
-            if uploaded_file.name.endswith('.csv'):
-                self.df = pd.read_csv(uploaded_file)
-            else:
-                self.df = pd.read_excel(uploaded_file)
+            self.file_bytes = uploaded_file.getvalue()
+            self.filename = uploaded_file.name
+            self.df = _read_file(self.file_bytes, self.filename)
             return True, "loaded successfully✅!"
         except Exception as e:
             return False, f"Error loading data: {str(e)}"
@@ -109,115 +481,117 @@ class DataAnalyzer:
         """Perform comprehensive EDA"""
         if self.df is None:
             return {}
-        
-        results = {}
-        
-        # Basic statistics
-        results['shape'] = self.df.shape
-        results['columns'] = list(self.df.columns)
-        results['data_types'] = self.df.dtypes.to_dict()
-        results['missing_values'] = self.df.isnull().sum().to_dict()
-        results['missing_percentage'] = (self.df.isnull().sum() / len(self.df) * 100).to_dict()
-        results['duplicates'] = int(self.df.duplicated().sum())
-        
-        # Numeric columns analysis
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        results['numeric_columns'] = list(numeric_cols)
-        results['numeric_stats'] = self.df[numeric_cols].describe().to_dict() if len(numeric_cols) > 0 else {}
-        
-        # Categorical columns analysis
-        categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns
-        results['categorical_columns'] = list(categorical_cols)
-        results['categorical_stats'] = {}
-        for col in categorical_cols:
-            results['categorical_stats'][col] = {
-                'unique_count': int(self.df[col].nunique()),
-                'top_categories': self.df[col].value_counts().head(5).to_dict()
-            }
-        
-        # Correlation analysis
-        if len(numeric_cols) > 1:
-            results['correlation_matrix'] = self.df[numeric_cols].corr()
-        
-        return results
+        if self.file_bytes is not None:
+            return _analyze(self.file_bytes, self.filename)
+        return _analyze_dataframe(self.df)
     
     def generate_ai_insights(self, analysis_results):
         """Generate AI-like insights based on data analysis"""
-        insights = []
-        if not analysis_results:
-            return insights
-        
-        # Dataset overview insights
-        rows, cols = analysis_results.get('shape', (0,0))
-        insights.append(f"📚 <b>Data Overview</b>: The dataset contains {rows:,} rows and {cols} columns.")
-        
-        # Missing values insights
-        total_missing = sum(analysis_results.get('missing_values', {}).values())
-        if total_missing > 0:
-            insights.append(f"🕵🏼‍♂️ <b>Data Quality</b>: {total_missing:,} missing values detected across the dataset.")
-        
-        # Numeric columns insights
-        numeric_cols = analysis_results.get('numeric_columns', [])
-        if numeric_cols:
-            numeric_insight = f"🔢 <b>Numeric Analysis</b>: {len(numeric_cols)} numeric columns found."
-            col = numeric_cols[0]
-            stats = analysis_results.get('numeric_stats', {}).get(col, {})
-            if isinstance(stats, dict) and 'mean' in stats:
-                try:
-                    numeric_insight += f" {col} has mean {stats['mean']:.2f} and std {stats['std']:.2f}."
-                except Exception:
-                    numeric_insight += f" {col} stats available."
-            insights.append(numeric_insight)
-        
-        # Categorical insights
-        categorical_cols = analysis_results.get('categorical_columns', [])
-        if categorical_cols:
-            cat_insight = f"🗂️ <b>Categorical Analysis<b/>: {len(categorical_cols)} categorical columns identified."
-            insights.append(cat_insight)
-        
-        # Correlation insights
-        if 'correlation_matrix' in analysis_results and analysis_results.get('correlation_matrix') is not None:
-            corr_matrix = analysis_results['correlation_matrix']
-            high_corr_pairs = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    if abs(corr_matrix.iloc[i, j]) > 0.7:
-                        high_corr_pairs.append(
-                            f"{corr_matrix.columns[i]} & {corr_matrix.columns[j]} ({corr_matrix.iloc[i, j]:.2f})"
-                        )
-            if high_corr_pairs:
-                insights.append(f"👨‍👩‍👧‍👦 <b>Strong Correlations</b>: Found between {', '.join(high_corr_pairs[:3])}")
-        
-        # Data quality insights
-        if analysis_results.get('duplicates', 0) > 0:
-            insights.append(f"🔍 <b>Data Quality</b>: {analysis_results['duplicates']} duplicate rows found.")
-        
-        return insights
+        return _generate_insights(analysis_results)
+
+# Bins per column for the distribution plots
+_HIST_BINS = 30
+
+# Row cap for point-based plots; beyond this the browser spends its time drawing points
+_PLOT_SAMPLE_ROWS = 10_000
+
+def _sample(df, n=_PLOT_SAMPLE_ROWS):
+    """Random row sample for plotting, or the frame itself if it is already small"""
+    return df if len(df) <= n else df.sample(n, random_state=0)
+
+# Points kept per time-series trace by LTTB downsampling
+_LTTB_POINTS = 2_000
+
+def _lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling of a sorted series; returns the kept indices"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    # first and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_lo = hi
+        next_hi = edges[b + 2] if b + 2 < len(edges) else n
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        # pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(np.argmax(area))
+        keep[b + 1] = prev
+    return keep
+
+def _group_box_stats(codes, values, n_groups):
+    """Box-plot statistics per group of factorized codes, from one sort of the data"""
+    valid = (codes >= 0) & np.isfinite(values)
+    codes, values = codes[valid], values[valid]
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+    sorted_values = values[np.lexsort((values, codes))]
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+
+    present = np.flatnonzero(counts)
+    box_stats = {key: [] for key in ('q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean')}
+    for g in present:
+        group = sorted_values[bounds[g]:bounds[g + 1]]
+        q1, median, q3 = np.quantile(group, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        # Tukey whiskers: the most extreme values within 1.5 IQR of the box
+        box_stats['q1'].append(q1)
+        box_stats['median'].append(median)
+        box_stats['q3'].append(q3)
+        box_stats['lowerfence'].append(group[np.searchsorted(group, q1 - 1.5 * iqr)])
+        box_stats['upperfence'].append(group[np.searchsorted(group, q3 + 1.5 * iqr, side='right') - 1])
+        box_stats['mean'].append(means[g])
+    return present, box_stats
 
 class InteractiveVisualizations:
-    def __init__(self, df):
+    def __init__(self, df, analysis_results=None):
         self.df = df
+        # reuse what the analysis already computed: column lists, histograms and the correlation matrix
+        analysis_results = analysis_results or {}
+        if 'numeric_columns' in analysis_results:
+            self.numeric_cols = list(analysis_results['numeric_columns'])
+        else:
+            self.numeric_cols = list(df.select_dtypes(include=[np.number]).columns)
+        if 'categorical_columns' in analysis_results:
+            self.categorical_cols = list(analysis_results['categorical_columns'])
+        else:
+            self.categorical_cols = list(df.select_dtypes(include=['object', 'category']).columns)
+        self.date_cols = list(df.select_dtypes(include=['datetime64']).columns)
+        self.histograms = analysis_results.get('histograms', {})
+        self.correlation_matrix = analysis_results.get('correlation_matrix')
     
     def create_correlation_heatmap(self):
         """Create interactive correlation heatmap"""
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        numeric_cols = self.numeric_cols
         if len(numeric_cols) < 2:
             return None
         
-        corr_matrix = self.df[numeric_cols].corr()
-        fig = px.imshow(
-            corr_matrix,
-            text_auto=True,
-            aspect="auto",
-            color_continuous_scale='RdBu_r',
-            title="Correlation Heatmap"
-        )
-        fig.update_layout(height=600)
+        corr_matrix = self.correlation_matrix
+        if corr_matrix is None:
+            X = self.df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            corr_matrix = _correlation(X)
+        # the ndarray goes straight into the trace, no DataFrame/imshow conversion
+        labels = [str(col) for col in numeric_cols]
+        fig = go.Figure(go.Heatmap(
+            z=np.asarray(corr_matrix, dtype=np.float32),
+            x=labels,
+            y=labels,
+            colorscale='RdBu_r',
+            zmid=0,
+            texttemplate='%{z:.2f}'
+        ))
+        fig.update_layout(title="Correlation Heatmap", height=600, yaxis_autorange='reversed')
         return fig
     
     def create_distribution_plots(self):
         """Create interactive distribution plots"""
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        numeric_cols = self.numeric_cols
         if len(numeric_cols) == 0:
             return None
         
@@ -235,8 +609,13 @@ class InteractiveVisualizations:
             row = (i // cols) + 1
             col_num = (i % cols) + 1
             
+            # bin server-side so only the bin counts are sent to the browser
+            if col in self.histograms:
+                counts, edges = self.histograms[col]
+            else:
+                counts, edges = _histogram(self.df[col].to_numpy(dtype=np.float64, na_value=np.nan))
             fig.add_trace(
-                go.Histogram(x=self.df[col], name=col, nbinsx=30),
+                go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name=col),
                 row=row, col=col_num
             )
         
@@ -245,14 +624,14 @@ class InteractiveVisualizations:
     
     def create_scatter_matrix(self):
         """Create interactive scatter matrix"""
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        numeric_cols = self.numeric_cols
         if len(numeric_cols) < 2:
             return None
         
         # Take first 4 numeric columns for scatter matrix
         selected_cols = numeric_cols[:4] if len(numeric_cols) > 4 else numeric_cols
         fig = px.scatter_matrix(
-            self.df[selected_cols],
+            _sample(self.df[selected_cols]),
             title="Scatter Matrix",
             height=800
         )
@@ -260,18 +639,23 @@ class InteractiveVisualizations:
     
     def create_time_series_plot(self):
         """Create time series plot if date column exists"""
-        date_columns = self.df.select_dtypes(include=['datetime64']).columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        date_columns = self.date_cols
+        numeric_cols = self.numeric_cols
         
         if len(date_columns) > 0 and len(numeric_cols) > 0:
             date_col = date_columns[0]
             numeric_col = numeric_cols[0]
             
-            fig = px.line(
-                self.df, 
-                x=date_col, 
-                y=numeric_col,
+            # LTTB keeps the visual shape of the series with a bounded number of points
+            plot_df = self.df[[date_col, numeric_col]].dropna().sort_values(date_col)
+            x = plot_df[date_col].to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+            y = plot_df[numeric_col].to_numpy(dtype=np.float64)
+            plot_df = plot_df.iloc[_lttb(x, y, _LTTB_POINTS)]
+            fig = go.Figure(go.Scattergl(x=plot_df[date_col], y=plot_df[numeric_col], mode='lines'))
+            fig.update_layout(
                 title=f"{numeric_col} over Time",
+                xaxis_title=date_col,
+                yaxis_title=numeric_col,
                 height=400
             )
             return fig
@@ -279,24 +663,66 @@ class InteractiveVisualizations:
     
     def create_categorical_analysis(self):
         """Create categorical data visualizations"""
-        categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        categorical_cols = self.categorical_cols
+        numeric_cols = self.numeric_cols
         
         if len(categorical_cols) > 0 and len(numeric_cols) > 0:
             cat_col = categorical_cols[0]
             num_col = numeric_cols[0]
             
-            # Box plot
-            fig = px.box(
-                self.df, 
-                x=cat_col, 
-                y=num_col,
+            # Box plot from per-category statistics computed over every row, not a sample
+            codes, categories = pd.factorize(self.df[cat_col], sort=True)
+            values = self.df[num_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            present, box_stats = _group_box_stats(codes, values, len(categories))
+            fig = go.Figure(go.Box(
+                x=[str(categories[g]) for g in present],
+                name=str(num_col),
+                **box_stats
+            ))
+            fig.update_layout(
                 title=f"{num_col} by {cat_col}",
+                xaxis_title=str(cat_col),
+                yaxis_title=str(num_col),
                 height=500
             )
             return fig
         return None
 
+def _frame_fingerprint(df):
+    """Content hash of a DataFrame, computed once per dataset and used as the figure cache key"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((list(df.columns), [str(t) for t in df.dtypes])).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+@st.cache_resource(max_entries=_CACHED_DATASETS, show_spinner=False)
+def _viz_view(df_hash, _df):
+    """Plotting copy of the dataset with float64 columns cast to float32, built once per dataset"""
+    view = _df.astype({col: np.float32 for col in _df.select_dtypes(include='float64').columns})
+    return _optimize_dtypes(view, categorize=False)
+
+# Visualization tab charts: (label, InteractiveVisualizations method, message when it can't be drawn)
+_VIZ_CHARTS = [
+    ("Correlation Heatmap", 'create_correlation_heatmap', "Need at least 2 numeric columns for correlation analysis"),
+    ("Distribution Analysis", 'create_distribution_plots', "No numeric columns found for distribution analysis"),
+    ("Scatter Matrix", 'create_scatter_matrix', "Need at least 2 numeric columns for scatter matrix"),
+    ("Categorical Analysis", 'create_categorical_analysis', "Need both categorical and numeric columns for this analysis"),
+]
+
+# one entry per chart of each cached dataset
+@st.cache_data(max_entries=_CACHED_DATASETS * len(_VIZ_CHARTS), show_spinner=False)
+def _build_figure(df_hash, method_name, _df, _analysis_results=None):
+    """Build one InteractiveVisualizations figure, cached per dataset fingerprint and chart"""
+    fig = getattr(InteractiveVisualizations(_df, _analysis_results), method_name)()
+    if fig is not None:
+        # a constant uirevision keeps zoom/pan and skips a full re-layout when a rerun re-sends the figure
+        fig.update_layout(uirevision='const')
+    return fig
+
+# clean_text tables, built once instead of per call
+_CLEAN_TRANS = str.maketrans({'•': '- ', '–': '-', '—': '-'})
+_NON_ASCII = re.compile(r'[^\x00-\x7F]+')
+
 class ReportGenerator:
     def __init__(self):
         # A4 dimensions in mm (210 x 297)
@@ -312,34 +738,17 @@ class ReportGenerator:
         """Sanitize text so it's safe for fpdf (latin-1). Removes or replaces problematic unicode."""
         if text is None:
             return ""
-        s = str(text)
-        # replace bullets/emojis/dashes with ascii equivalents
-        s = s.replace('•', '- ')
-        s = s.replace('–', '-')
-        s = s.replace('—', '-')
-        # remove other emoji ranges and non-ascii characters
-        s = re.sub(r'[\u2600-\u26FF\u2700-\u27BF]', '', s)  # miscellaneous symbols
-        s = re.sub(r'[^\x00-\x7F]+', '', s)  # remove any remaining non-ascii
-        return s
-
-    def generate_pdf_report(self, analysis_results, insights, output_file=None):
+        # replace bullets/dashes with ascii equivalents, then drop emojis and any other non-ascii
+        return _NON_ASCII.sub('', str(text).translate(_CLEAN_TRANS))
+
+    def generate_pdf_report(self, analysis_results, insights):
         """
-        Generate a PDF report with proper A4 formatting and margins
+        Generate a PDF report with proper A4 formatting and margins, returned as bytes
         """
         try:
             analysis_results = analysis_results or {}
             insights = insights or []
 
-            if output_file is None:
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                output_path = tmp.name
-                tmp.close()
-            else:
-                output_path = str(output_file)
-                parent = Path(output_path).parent
-                if not parent.exists():
-                    parent.mkdir(parents=True, exist_ok=True)
-
             # Create PDF with A4 format and proper margins
             pdf = FPDF(orientation='P', unit='mm', format='A4')
             pdf.set_auto_page_break(auto=True, margin=self.bottom_margin)
@@ -401,7 +810,8 @@ class ReportGenerator:
             pdf.ln(8)
 
             shape = analysis_results.get('shape', (0, 0))
-            missing_total = sum(analysis_results.get('missing_values', {}).values()) if analysis_results.get('missing_values') else 0
+            missing_values = analysis_results.get('missing_values')
+            missing_total = int(missing_values.sum()) if missing_values is not None else 0
             duplicates = analysis_results.get('duplicates', 0)
             numeric_cols_count = len(analysis_results.get('numeric_columns', []))
             categorical_cols_count = len(analysis_results.get('categorical_columns', []))
@@ -415,10 +825,7 @@ class ReportGenerator:
                 f"Categorical Columns: {categorical_cols_count}"
             ]
 
-            pdf.set_font(default_font_family, '', 11)
-            for item in overview_data:
-                write_multiline(f"• {item}", size=11, line_height=6)
-                pdf.ln(1)
+            write_multiline("\n".join(f"• {item}" for item in overview_data), size=11, line_height=6)
 
             # Data Types Summary
             pdf.ln(5)
@@ -510,10 +917,7 @@ class ReportGenerator:
                 "Consider time-series analysis if temporal patterns are present"
             ]
 
-            pdf.set_font(default_font_family, '', 11)
-            for i, recommendation in enumerate(recommendations, 1):
-                write_multiline(f"{i}. {recommendation}", size=11, line_height=6)
-                pdf.ln(2)
+            write_multiline("\n".join(f"{i}. {recommendation}" for i, recommendation in enumerate(recommendations, 1)), size=11, line_height=6)
 
             # Data Quality Assessment
             pdf.ln(5)
@@ -530,10 +934,7 @@ class ReportGenerator:
                 f"Variable Diversity: Good mix of numeric and categorical variables" if numeric_cols_count > 0 and categorical_cols_count > 0 else "Limited variable diversity"
             ]
 
-            pdf.set_font(default_font_family, '', 10)
-            for metric in quality_metrics:
-                write_multiline(f"• {metric}", size=10, line_height=5)
-                pdf.ln(1)
+            write_multiline("\n".join(f"• {metric}" for metric in quality_metrics), size=10, line_height=5)
 
             # Final Page - Conclusion
             pdf.add_page()
@@ -562,15 +963,243 @@ or advanced statistical techniques based on the specific business objectives.
             pdf.set_font(default_font_family, 'I', 8)
             pdf.cell(self.content_width, 4, "Generated by AI Data Storyteller - Automated Data Analysis Tool", ln=True, align='C')
 
-            # Save PDF
-            pdf.output(output_path)
-            return output_path
+            # Render in memory; fpdf 1.x returns a latin-1 str, fpdf2 a bytearray
+            pdf_data = pdf.output(dest='S')
+            return pdf_data.encode('latin-1') if isinstance(pdf_data, str) else bytes(pdf_data)
 
         except Exception as e:
             print("Error generating PDF:", e)
             traceback.print_exc()
             return None
 
+@_fragment
+def _render_insights_tab(analysis_results, insights):
+    """AI Insights tab; checkbox toggles rerun only this fragment"""
+    st.header("Data teller 💀")
+
+    # Display insights with checkboxes and red bars
+    for i, insight in enumerate(insights, 1):
+        col1, col2 = st.columns([0.05, 0.95])
+        with col1:
+            default_value = i in [2, 5]
+            st.checkbox("", key=f"insight_{i}", value=default_value)
+        with col2:
+            st.markdown(
+                f'<div style="background-color:#f5d7d7; padding: 15px; border-left: 5px solid #de0202 ; border-radius: 10px; margin: 5px 0;">{insight}</div>',
+                unsafe_allow_html=True
+            )
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    with col1:
+        if analysis_results['numeric_columns']:
+            st.subheader("📈 Numeric Statistics")
+            numeric_stats = pd.DataFrame(analysis_results['numeric_stats'])
+            st.dataframe(numeric_stats, use_container_width=True)
+    with col2:
+        if analysis_results['categorical_columns']:
+            st.subheader("📝 Categorical Analysis")
+            for col in analysis_results['categorical_columns'][:3]:
+                st.write(f"**{col}**: {analysis_results['categorical_stats'][col]['unique_count']} unique values")
+                top_cats = analysis_results['categorical_stats'][col]['top_categories']
+                st.write("Top categories:", ", ".join([f"{k} ({v})" for k, v in list(top_cats.items())[:3]]))
+
+def _pack_results(analysis_results, insights):
+    """Compressed pickle of the analysis output, as kept in session state"""
+    return _compress(pickle.dumps((analysis_results, insights), protocol=pickle.HIGHEST_PROTOCOL))
+
+def _load_results():
+    """Unpack the session's analysis results and insights"""
+    if st.session_state.analysis_blob is None:
+        return {}, []
+    return pickle.loads(_decompress(st.session_state.analysis_blob))
+
+@st.cache_data(show_spinner=False)
+def _sample_dataframe(n=100, seed=0):
+    """Deterministic demo dataset for the sample-data button"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Date': pd.date_range('2023-01-01', periods=n, freq='D'),
+        'Sales': rng.normal(1000, 200, n).cumsum(),
+        'Customers': rng.poisson(50, n),
+        'Region': rng.choice(np.array(['North', 'South', 'East', 'West']), n),
+        'Product_Category': rng.choice(np.array(['Electronics', 'Clothing', 'Food', 'Books']), n),
+        'Revenue': rng.exponential(500, n)
+    })
+
+def _in_script_ctx(ctx, func, *args):
+    """Call func in a worker thread with the submitting session's ScriptRunContext attached,
+    so the st.cache_* functions it calls run with the same context as on the script thread"""
+    add_script_run_ctx(ctx=ctx)
+    return func(*args)
+
+@st.cache_resource
+def _report_executor():
+    """Worker pool for PDF generation, shared across sessions and reruns"""
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_resource
+def _report_generator():
+    """Shared ReportGenerator instance"""
+    return ReportGenerator()
+
+@st.cache_data(max_entries=_CACHED_DATASETS, show_spinner=False)
+def _build_report_bytes(df_hash, _analysis_results, insights):
+    """PDF report bytes, cached per dataset fingerprint so repeat downloads skip regeneration"""
+    return _report_generator().generate_pdf_report(_analysis_results, insights)
+
+@_fragment
+def _viz_tab(analysis_results):
+    """Visualizations tab; chart selection and Render clicks rerun only this fragment"""
+    st.header("📈 Interactive Visualizations")
+    # float32 view shared by every chart of this dataset; halves the arrays sent to the browser
+    df = _viz_view(st.session_state.df_hash, st.session_state.analyzer.df)
+    viz_option = st.selectbox(
+        "Choose Visualization Type",
+        [label for label, _, _ in _VIZ_CHARTS] + ["All Visualizations"]
+    )
+    if viz_option == "All Visualizations":
+        # each chart is built only once its Render button has been clicked for this dataset
+        if st.button("Render all", key="render_all"):
+            # build the charts concurrently (pandas/NumPy release the GIL); the tabs below then hit the cache
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(max_workers=len(_VIZ_CHARTS)) as pool:
+                futures = [
+                    pool.submit(_in_script_ctx, ctx, _build_figure, st.session_state.df_hash, method_name, df, analysis_results)
+                    for _, method_name, _ in _VIZ_CHARTS
+                ]
+                for future in futures:
+                    future.result()
+            st.session_state.rendered_viz.update((st.session_state.df_hash, method_name) for _, method_name, _ in _VIZ_CHARTS)
+        viz_tabs = st.tabs([label for label, _, _ in _VIZ_CHARTS])
+        for viz_tab, (label, method_name, empty_message) in zip(viz_tabs, _VIZ_CHARTS):
+            with viz_tab:
+                render_key = (st.session_state.df_hash, method_name)
+                if render_key not in st.session_state.rendered_viz:
+                    if st.button("Render", key=f"render_{method_name}"):
+                        st.session_state.rendered_viz.add(render_key)
+                if render_key in st.session_state.rendered_viz:
+                    fig = _build_figure(st.session_state.df_hash, method_name, df, analysis_results)
+                    if fig:
+                        st.plotly_chart(fig, use_container_width=True, key=f"all_{method_name}")
+                    else:
+                        st.warning(empty_message)
+    else:
+        _, method_name, empty_message = next(chart for chart in _VIZ_CHARTS if chart[0] == viz_option)
+        fig = _build_figure(st.session_state.df_hash, method_name, df, analysis_results)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning(empty_message)
+
+@_fragment_every(_REPORT_POLL_SECONDS)
+def _report_progress():
+    """Polls the background PDF job; only this fragment reruns until the job finishes"""
+    report_hash, future = st.session_state.report_future
+    if not future.done():
+        st.info("⏳ Generating report...")
+        return
+    st.session_state.report_future = None
+    try:
+        pdf_bytes = future.result()
+        if pdf_bytes:
+            st.session_state.report = (report_hash, pdf_bytes)
+            st.session_state.report_notice = ('success', "✅ PDF report generated successfully!", None)
+        else:
+            st.session_state.report_notice = ('error', "Report generation failed. No PDF produced. Check app logs/console for details.", None)
+    except Exception as e:
+        st.session_state.report_notice = ('error', f"Unexpected error while generating report: {str(e)}", traceback.format_exc())
+    # one app rerun drops this polling fragment and shows the outcome and download button
+    st.rerun()
+
+@_fragment
+def _report_tab(analysis_results, insights):
+    """Report tab; generating and polling the PDF reruns only this fragment"""
+    st.header("📄 Report Generation")
+    st.subheader("Executive Summary")
+    st.write("Generate a comprehensive PDF report with all analysis findings.")
+    if st.button("📥 Generate PDF Report", type="primary"):
+        # build in a worker thread so the app stays responsive; _report_progress polls the future
+        future = _report_executor().submit(
+            _in_script_ctx,
+            get_script_run_ctx(),
+            _build_report_bytes,
+            st.session_state.df_hash,
+            analysis_results, 
+            insights
+        )
+        st.session_state.report_future = (st.session_state.df_hash, future)
+    if st.session_state.report_future is not None:
+        _report_progress()
+    if st.session_state.report_notice is not None:
+        kind, message, details = st.session_state.report_notice
+        st.session_state.report_notice = None
+        getattr(st, kind)(message)
+        if details:
+            st.text(details)
+    # the bytes stay in session state, so the download button survives reruns (including its own click)
+    report_hash, pdf_bytes = st.session_state.report
+    if pdf_bytes and report_hash == st.session_state.df_hash:
+        st.download_button(
+            label="📄 Download AI Analysis Report",
+            data=pdf_bytes,
+            file_name="ai_data_analysis_report.pdf",
+            mime="application/pdf",
+            type="primary"
+        )
+    # Report preview
+    st.subheader("Report Preview")
+    st.write("**Key sections included in the report:**")
+    st.write("✅ Executive Summary")
+    st.write("✅ Dataset Overview")
+    st.write("✅ Numeric Analysis")
+    st.write("✅ Categorical Analysis")
+    st.write("✅ Data Quality Assessment")
+    st.write("✅ Recommendations & Conclusions")
+    st.write("✅ Professional A4 Formatting")
+
+def _render_analysis_ui():
+    """Overview, insights, visualization and report tabs for the analysed dataset"""
+    # unpacked once per run; fragment reruns reuse the arguments they were called with
+    analysis_results, insights = _load_results()
+    tab1, tab2, tab3, tab4 = st.tabs(["   Dataset Overview    ", "   AI Insights   ", "   Visualizations   ", "   Report   "])
+    with tab1:
+        st.header("👩‍💻 Dataset Overview")
+            
+        # Key metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Rows", f"{analysis_results['shape'][0]:,}")
+        with col2:
+            st.metric("Total Columns", analysis_results['shape'][1])
+        with col3:
+            missing_total = int(analysis_results['missing_values'].sum())
+            st.metric("Missing Values", f"{missing_total:,}")
+        with col4:
+            st.metric("Duplicate Rows", analysis_results['duplicates'])
+            
+        # Data preview
+        st.subheader("Data Preview")
+        st.dataframe(st.session_state.analyzer.df.head(10), use_container_width=True)
+            
+        # Data types information
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Data Types")
+            st.dataframe(analysis_results['dtype_df'], use_container_width=True)
+            
+        with col2:
+            st.subheader("Missing Values Analysis")
+            st.dataframe(analysis_results['missing_df'], use_container_width=True)
+        
+    with tab2:
+        _render_insights_tab(analysis_results, insights)
+        
+    with tab3:
+        _viz_tab(analysis_results)
+    
+    with tab4:
+        _report_tab(analysis_results, insights)
+
 def main():
     # Header
     st.markdown('<div class="main-header"> <b>🦾 AI - Data teller</b> </div>', unsafe_allow_html=True)
@@ -580,16 +1209,24 @@ def main():
         st.session_state.analyzer = DataAnalyzer()
     if 'analysis_done' not in st.session_state:
         st.session_state.analysis_done = False
-    if 'analysis_results' not in st.session_state:
-        st.session_state.analysis_results = {}
-    if 'insights' not in st.session_state:
-        st.session_state.insights = []
+    if 'analysis_blob' not in st.session_state:
+        st.session_state.analysis_blob = None
+    if 'df_hash' not in st.session_state:
+        st.session_state.df_hash = None
+    if 'rendered_viz' not in st.session_state:
+        st.session_state.rendered_viz = set()
+    if 'report' not in st.session_state:
+        st.session_state.report = (None, None)
+    if 'report_future' not in st.session_state:
+        st.session_state.report_future = None
+    if 'report_notice' not in st.session_state:
+        st.session_state.report_notice = None
     
     # Sidebar
     
     with st.sidebar:
         st.header("Upload file 🗃️")
-        uploaded_file = st.file_uploader("Select one file", type=['csv', 'xlsx'])
+        uploaded_file = st.file_uploader("Select one file", type=['csv', 'xlsx', 'parquet'])
        
         if uploaded_file is not None:
             success, message = st.session_state.analyzer.load_data(uploaded_file)
@@ -597,16 +1234,11 @@ def main():
                 st.success("✅ " + message)
                 if st.button("AI Analysis 💻", type="primary", use_container_width=True):
                     with st.spinner("Performing comprehensive analysis..."):
-                        st.session_state.analysis_results = st.session_state.analyzer.perform_comprehensive_analysis()
-                        st.session_state.insights = st.session_state.analyzer.generate_ai_insights(st.session_state.analysis_results)
+                        analysis_results = st.session_state.analyzer.perform_comprehensive_analysis()
+                        insights = st.session_state.analyzer.generate_ai_insights(analysis_results)
+                        st.session_state.analysis_blob = _pack_results(analysis_results, insights)
+                        st.session_state.df_hash = _frame_fingerprint(st.session_state.analyzer.df)
                         st.session_state.analysis_done = True
-                        try:
-                            st.rerun()
-                        except Exception:
-                            try:
-                                st.experimental_rerun()
-                            except Exception:
-                                pass
             else:
                 st.error("❌ " + message)
         
@@ -621,229 +1253,38 @@ def main():
     
     # Main content area with tabs
     if st.session_state.analysis_done and st.session_state.analyzer.df is not None:
-        tab1, tab2, tab3, tab4 = st.tabs(["   Dataset Overview    ", "   AI Insights   ", "   Visualizations   ", "   Report   "])
-        st.markdown(
-    """
-    <style>
-    /* Tab bar */
-    .stTabs [data-baseweb="tab-list"] {
-        background-color:#0A090 ; /* Tab container background */
-        border-radius: 15px;
-        padding: 5px;
-    }
-
-    /* Individual tab */
-    .stTabs [data-baseweb="tab"] {
-        background-color:#B1B1B1 ; /* Inactive tab */
-        color: white !important;
-        border-radius: 10px;
-        margin-right: 15px;
-    }
-
-    /* Active tab */
-    .stTabs [aria-selected="true"] {
-        background-color:#96090B  !important; /* Active tab color */
-        color: black !important;
-        font-weight: bold;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
-        with tab1:
-            st.header("👩‍💻 Dataset Overview")
-            
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Rows", f"{st.session_state.analysis_results['shape'][0]:,}")
-            with col2:
-                st.metric("Total Columns", st.session_state.analysis_results['shape'][1])
-            with col3:
-                missing_total = sum(st.session_state.analysis_results['missing_values'].values())
-                st.metric("Missing Values", f"{missing_total:,}")
-            with col4:
-                st.metric("Duplicate Rows", st.session_state.analysis_results['duplicates'])
-            
-            # Data preview
-            st.subheader("Data Preview")
-            st.dataframe(st.session_state.analyzer.df.head(10), use_container_width=True)
-            
-            # Data types information
-            col1, col2 = st.columns(2)
-            with col1:
-                st.subheader("Data Types")
-                dtype_df = pd.DataFrame({
-                    'Column': st.session_state.analysis_results['columns'],
-                    'Data Type': [str(st.session_state.analysis_results['data_types'][col]) for col in st.session_state.analysis_results['columns']]
-                })
-                st.dataframe(dtype_df, use_container_width=True)
+        _render_analysis_ui()
+    
+    else:
+        # Welcome screen when no data is loaded; held in a placeholder so it can be cleared
+        welcome = st.empty()
+        with welcome.container():
+            st.markdown("""
+            <div style='text-align: center; padding: 50px;'>
+                <h2> Welcome to Data teller </h2>
+                <p><h3>Upload your dataset to get started with Data Telling <h3></p>
+            </div>
+            """, unsafe_allow_html=True)
             
+            # Sample data option
+            col1, col2, col3 = st.columns([1,2,1])
             with col2:
-                st.subheader("Missing Values Analysis")
-                missing_df = pd.DataFrame({
-                    'Column': list(st.session_state.analysis_results['missing_values'].keys()),
-                    'Missing Count': list(st.session_state.analysis_results['missing_values'].values()),
-                    'Missing %': list(st.session_state.analysis_results['missing_percentage'].values())
-                })
-                st.dataframe(missing_df, use_container_width=True)
+                load_sample = st.button("Upload Sample Data 💾", use_container_width=True)
         
-        with tab2:
-            st.header("Data teller 💀")
+        if load_sample:
+            sample_df = _sample_dataframe()
             
-            # Display insights with checkboxes and red bars
-            for i, insight in enumerate(st.session_state.insights, 1):
-                col1, col2 = st.columns([0.05, 0.95])
-                with col1:
-                    default_value = i in [2, 5]
-                    st.checkbox("", key=f"insight_{i}", value=default_value)
-                with col2:
-                    st.markdown(
-                        f'<div style="background-color:#f5d7d7; padding: 15px; border-left: 5px solid #de0202 ; border-radius: 10px; margin: 5px 0;">{insight}</div>',
-                        unsafe_allow_html=True
-                    )
-            st.markdown("---")
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.session_state.analysis_results['numeric_columns']:
-                    st.subheader("📈 Numeric Statistics")
-                    numeric_stats = pd.DataFrame(st.session_state.analysis_results['numeric_stats'])
-                    st.dataframe(numeric_stats, use_container_width=True)
-            with col2:
-                if st.session_state.analysis_results['categorical_columns']:
-                    st.subheader("📝 Categorical Analysis")
-                    for col in st.session_state.analysis_results['categorical_columns'][:3]:
-                        st.write(f"**{col}**: {st.session_state.analysis_results['categorical_stats'][col]['unique_count']} unique values")
-                        top_cats = st.session_state.analysis_results['categorical_stats'][col]['top_categories']
-                        st.write("Top categories:", ", ".join([f"{k} ({v})" for k, v in list(top_cats.items())[:3]]))
-        
-        with tab3:
-            st.header("📈 Interactive Visualizations")
-            visualizer = InteractiveVisualizations(st.session_state.analyzer.df)
-            viz_option = st.selectbox(
-                "Choose Visualization Type",
-                ["Correlation Heatmap", "Distribution Analysis", "Scatter Matrix", "Categorical Analysis", "All Visualizations"]
-            )
-            if viz_option == "Correlation Heatmap":
-                fig = visualizer.create_correlation_heatmap()
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Need at least 2 numeric columns for correlation analysis")
-            elif viz_option == "Distribution Analysis":
-                fig = visualizer.create_distribution_plots()
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("No numeric columns found for distribution analysis")
-            elif viz_option == "Scatter Matrix":
-                fig = visualizer.create_scatter_matrix()
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Need at least 2 numeric columns for scatter matrix")
-            elif viz_option == "Categorical Analysis":
-                fig = visualizer.create_categorical_analysis()
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Need both categorical and numeric columns for this analysis")
-            elif viz_option == "All Visualizations":
-                col1, col2 = st.columns(2)
-                with col1:
-                    fig1 = visualizer.create_correlation_heatmap()
-                    if fig1:
-                        st.plotly_chart(fig1, use_container_width=True)
-                    fig3 = visualizer.create_distribution_plots()
-                    if fig3:
-                        st.plotly_chart(fig3, use_container_width=True)
-                with col2:
-                    fig2 = visualizer.create_scatter_matrix()
-                    if fig2:
-                        st.plotly_chart(fig2, use_container_width=True)
-                    fig4 = visualizer.create_categorical_analysis()
-                    if fig4:
-                        st.plotly_chart(fig4, use_container_width=True)
-        
-        with tab4:
-            st.header("📄 Report Generation")
-            st.subheader("Executive Summary")
-            st.write("Generate a comprehensive PDF report with all analysis findings.")
-            report_gen = ReportGenerator()
-            if st.button("📥 Generate PDF Report", type="primary"):
-                with st.spinner("Generating report..."):
-                    try:
-                        report_path = report_gen.generate_pdf_report(
-                            st.session_state.analysis_results, 
-                            st.session_state.insights
-                        )
-                        if report_path and os.path.exists(report_path):
-                            with open(report_path, "rb") as file:
-                                st.download_button(
-                                    label="📄 Download AI Analysis Report",
-                                    data=file,
-                                    file_name="ai_data_analysis_report.pdf",
-                                    mime="application/pdf",
-                                    type="primary"
-                                )
-                            st.success("✅ PDF report generated successfully!")
-                            # optional: remove after offering download
-                            try:
-                                os.remove(report_path)
-                            except Exception:
-                                pass
-                        else:
-                            st.error("Report generation failed. No PDF produced. Check app logs/console for details.")
-                    except Exception as e:
-                        st.error(f"Unexpected error while generating report: {str(e)}")
-                        st.text(traceback.format_exc())
-            # Report preview
-            st.subheader("Report Preview")
-            st.write("**Key sections included in the report:**")
-            st.write("✅ Executive Summary")
-            st.write("✅ Dataset Overview")
-            st.write("✅ Numeric Analysis")
-            st.write("✅ Categorical Analysis")
-            st.write("✅ Data Quality Assessment")
-            st.write("✅ Recommendations & Conclusions")
-            st.write("✅ Professional A4 Formatting")
-    
-    else:
-        # Welcome screen when no data is loaded
-        st.markdown("""
-        <div style='text-align: center; padding: 50px;'>
-            <h2> Welcome to Data teller </h2>
-            <p><h3>Upload your dataset to get started with Data Telling <h3></p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Sample data option
-        col1, col2, col3 = st.columns([1,2,1])
-        with col2:
-            if st.button("Upload Sample Data 💾", use_container_width=True):
-                # Create sample data
-                sample_data = {
-                    'Date': pd.date_range('2023-01-01', periods=100, freq='D'),
-                    'Sales': np.random.normal(1000, 200, 100).cumsum(),
-                    'Customers': np.random.poisson(50, 100),
-                    'Region': np.random.choice(['North', 'South', 'East', 'West'], 100),
-                    'Product_Category': np.random.choice(['Electronics', 'Clothing', 'Food', 'Books'], 100),
-                    'Revenue': np.random.exponential(500, 100)
-                }
-                sample_df = pd.DataFrame(sample_data)
-                
-                # Load sample data
-                st.session_state.analyzer.df = sample_df
-                st.session_state.analysis_results = st.session_state.analyzer.perform_comprehensive_analysis()
-                st.session_state.insights = st.session_state.analyzer.generate_ai_insights(st.session_state.analysis_results)
-                st.session_state.analysis_done = True
-                try:
-                    st.rerun()
-                except Exception:
-                    try:
-                        st.experimental_rerun()
-                    except Exception:
-                        pass
+            # Load sample data
+            st.session_state.analyzer.file_bytes = None
+            st.session_state.analyzer.df = sample_df
+            analysis_results = st.session_state.analyzer.perform_comprehensive_analysis()
+            insights = st.session_state.analyzer.generate_ai_insights(analysis_results)
+            st.session_state.analysis_blob = _pack_results(analysis_results, insights)
+            st.session_state.df_hash = _frame_fingerprint(sample_df)
+            st.session_state.analysis_done = True
+            # render the tabs in this run instead of rerunning the whole script
+            welcome.empty()
+            _render_analysis_ui()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
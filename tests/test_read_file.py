@@ -0,0 +1,46 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import Ai_story_teller as app  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+
+class UploadedFile:
+    """Minimal stand-in for Streamlit's UploadedFile"""
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def getvalue(self):
+        return self._data
+
+
+class ReadCsvTest(unittest.TestCase):
+    def test_latin1_csv_is_rejected_like_the_c_engine(self):
+        data = (FIXTURES / 'latin1.csv').read_bytes()
+        with self.assertRaises(UnicodeDecodeError):
+            app._read_file(data, 'latin1.csv')
+
+    def test_latin1_upload_reports_a_load_error(self):
+        data = (FIXTURES / 'latin1.csv').read_bytes()
+        success, message = app.DataAnalyzer().load_data(UploadedFile('latin1.csv', data))
+        self.assertFalse(success)
+        self.assertTrue(message.startswith("Error loading data"))
+
+    def test_ragged_rows_are_padded_like_the_c_engine(self):
+        df = app._read_file(b"a,b\n1,2\n3\n", 'ragged.csv')
+        self.assertEqual(df.shape, (2, 2))
+        self.assertTrue(df['b'].isna().iloc[1])
+
+    def test_utf8_csv_loads_as_text(self):
+        df = app._read_file("name,amount\ncafé,1\nnaïve,2\n".encode('utf-8'), 'utf8.csv')
+        self.assertEqual(list(df['name'].astype(str)), ['café', 'naïve'])
+
+
+if __name__ == '__main__':
+    unittest.main()